@@ -14,7 +14,7 @@ from ase.calculators.genericfileio import (
     GenericFileIOCalculator,
 )
 
-from raspa_ase.utils.dicts import merge_parameters, pop_parameter
+from raspa_ase.utils.dicts import get_parameter, merge_parameters, pop_parameter
 from raspa_ase.utils.io import parse_output, write_frameworks, write_simulation_input
 from raspa_ase.utils.params import get_framework_params
 
@@ -34,7 +34,8 @@ class RaspaProfile(BaseProfile):
 
     def __init__(self, command: Path | str | None = None, **kwargs) -> None:
         """
-        Initialize the RASPA profile. $RASPA_DIR must be set in the environment.
+        Initialize the RASPA profile. If no command is given, $RASPA_DIR must be
+        set in the environment by the time RASPA is run.
 
         Parameters
         ----------
@@ -46,12 +47,29 @@ class RaspaProfile(BaseProfile):
         -------
         None
         """
-        if not command:
+        super().__init__(command or "", **kwargs)
+
+    @property
+    def command(self) -> str:
+        """
+        The command to run RASPA. If not set, it is resolved from $RASPA_DIR
+        on first access.
+
+        Returns
+        -------
+        str
+            The command to run RASPA.
+        """
+        if not self._command:
             raspa_dir = os.environ.get("RASPA_DIR")
             if not raspa_dir:
                 raise OSError("RASPA_DIR environment variable not set")
-            command = f"{raspa_dir}/bin/simulate"
-        super().__init__(command, **kwargs)
+            self._command = f"{raspa_dir}/bin/simulate"
+        return self._command
+
+    @command.setter
+    def command(self, command: str) -> None:
+        self._command = command
 
     def get_calculator_command(self, inputfile: str = SIMULATION_INPUT) -> list[str]:
         """
@@ -139,10 +157,14 @@ class RaspaTemplate(CalculatorTemplate):
         None
         """
         frameworks = self.frameworks if self.frameworks else [atoms]
-        parameters = merge_parameters(parameters, get_framework_params([atoms]))
+        cutoff = float(get_parameter(parameters, "CutOff", default=12.0))
+        parameters = merge_parameters(
+            parameters, get_framework_params([atoms], cutoff=cutoff)
+        )
 
         write_simulation_input(parameters, directory / self.inputname)
-        write_frameworks(frameworks, directory)
+        if any(len(framework) for framework in frameworks):
+            write_frameworks(frameworks, directory)
 
     def execute(self, directory: Path | str, profile: RaspaProfile) -> None:
         profile.run(
@@ -168,10 +190,10 @@ class RaspaTemplate(CalculatorTemplate):
             The RASPA results, formatted as a dictionary.
         """
         output_path = Path(directory) / "Output"
-        systems = Path(output_path).glob("System_*")
+        systems = output_path.glob("System_*")
         results = {"energy": None}
         for system in systems:
-            data_files = Path(system).glob("*.data")
+            data_files = system.glob("*.data")
             results[system.name] = {}
             for data_file in data_files:
                 output = parse_output(data_file)
@@ -370,16 +392,17 @@ class Raspa(GenericFileIOCalculator):
         components = components or []
         parameters = parameters or {}
 
-        parameters = merge_parameters(
-            parameters, get_framework_params(multiple_frameworks)
-        )
+        if multiple_frameworks:
+            cutoff = float(get_parameter(parameters, "CutOff", default=12.0))
+            additions = get_framework_params(multiple_frameworks, cutoff=cutoff)
+        else:
+            additions = {}
         for i, component in enumerate(components):
             molecule_name = pop_parameter(component, "MoleculeName")
-            parameters = merge_parameters(
-                parameters, {f"Component {i} MoleculeName {molecule_name}": component}
-            )
+            additions[f"Component {i} MoleculeName {molecule_name}"] = component
         for i, box in enumerate(boxes):
-            parameters = merge_parameters(parameters, {f"Box {i}": box})
+            additions[f"Box {i}"] = box
+        parameters = merge_parameters(parameters, additions)
 
         super().__init__(
             template=RaspaTemplate(frameworks=multiple_frameworks),
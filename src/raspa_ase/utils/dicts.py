@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -25,9 +24,8 @@ def get_parameter(d: dict[str, Any], key: str, default: Any = None) -> Any:
     Any
         The value of the parameter, or the default value if the parameter is not found.
     """
-    d_lower = {k.lower(): v for k, v in d.items()}
-
-    return d_lower.get(key.lower(), default)
+    key = key.lower()
+    return next((v for k, v in d.items() if k.lower() == key), default)
 
 
 def pop_parameter(d: dict[str, Any], key: str) -> Any:
@@ -46,8 +44,9 @@ def pop_parameter(d: dict[str, Any], key: str) -> Any:
     Any
         The value of the parameter or None if the parameter is not found.
     """
+    key = key.lower()
     for k, v in d.items():
-        if k.lower() == key.lower():
+        if k.lower() == key:
             del d[k]
             return v
     return None
@@ -55,7 +54,8 @@ def pop_parameter(d: dict[str, Any], key: str) -> Any:
 
 def merge_parameters(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
     """
-    Merge two dictionaries, ignoring case.
+    Merge two dictionaries, ignoring case. Neither dictionary is modified,
+    but nested values are shared with the inputs rather than copied.
 
     Parameters
     ----------
@@ -69,24 +69,20 @@ def merge_parameters(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str,
     dict
         The merged dictionary.
     """
-    merged_dict = deepcopy(dict1)
+    merged_dict = dict(dict1)
+    lowered_keys = {key1.lower(): key1 for key1 in merged_dict}
 
     for key2, value2 in dict2.items():
-        matching_key = next(
-            (key1 for key1 in merged_dict if key1.lower() == key2.lower()), None
-        )
-
-        if matching_key:
-            merged_dict[matching_key] = value2
-        else:
-            merged_dict[key2] = value2
+        matching_key = lowered_keys.setdefault(key2.lower(), key2)
+        merged_dict[matching_key] = value2
 
     return merged_dict
 
 
 def convert_booleans(d: dict[str, Any]) -> dict[str, Any]:
     """
-    Recursively convert boolean values to "yes" or "no".
+    Convert boolean values to "yes" or "no", including in nested dictionaries.
+    The dictionary is modified in place.
 
     Parameters
     ----------
@@ -98,9 +94,14 @@ def convert_booleans(d: dict[str, Any]) -> dict[str, Any]:
     dict
         The dictionary with the boolean values converted to "Yes" or "No".
     """
-    for key, value in d.items():
-        if isinstance(value, bool):
-            d[key] = "Yes" if value else "No"
-        elif isinstance(value, dict):
-            convert_booleans(value)
+    stack = [d]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if value is True:
+                node[key] = "Yes"
+            elif value is False:
+                node[key] = "No"
+            elif isinstance(value, dict):
+                stack.append(value)
     return d
@@ -5,18 +5,21 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ase.atoms import Atoms
-from pymatgen.io.ase import AseAtomsAdaptor
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any, TextIO
 
-from raspa_ase.utils.dicts import convert_booleans
+    from ase.atoms import Atoms
 
-if TYPE_CHECKING:
-    from typing import Any
+# Patterns used to split rows of the RASPA output file
+COLUMN_SPLITTER = re.compile(r"\s{2,}")
+NOTE_SPLITTER = re.compile(r"[:\s]{2,}")
+FIELD_SPLITTER = re.compile(r"[()[\]:,\t]")
 
 
 def write_simulation_input(
-    parameters: dict[str, Any], input_filepath: str | Path
-) -> str:
+    parameters: dict[str, Any], input_filepath: str | Path | TextIO
+) -> None:
     """
     Write the `simulation.input` file for a given set of parameters.
 
@@ -25,29 +28,19 @@ def write_simulation_input(
     parameters
         The parameters to write to the simulation input file.
     input_filepath
-        The path to the simulation input file.
+        The path to the simulation input file, or an open text file to
+        write to.
 
     Returns
     -------
-    str
-        The simulation input string.
+    None
     """
-
-    simulation_input = ""
-    parameters = convert_booleans(parameters)
-
-    for k, v in parameters.items():
-        if isinstance(v, dict):
-            simulation_input += f"{k}\n"
-            simulation_input += _dict_to_str(v)
-        elif isinstance(v, list):
-            simulation_input += f"{k} "
-            simulation_input += _iterable_to_str(v)
-        else:
-            simulation_input += f"{k} {v}\n"
+    if hasattr(input_filepath, "write"):
+        input_filepath.writelines(_dict_to_lines(parameters))
+        return
 
     with Path(input_filepath).open(mode="w") as fd:
-        fd.write(simulation_input)
+        fd.writelines(_dict_to_lines(parameters))
 
 
 def write_frameworks(frameworks: list[Atoms], directory: str | Path) -> None:
@@ -65,13 +58,17 @@ def write_frameworks(frameworks: list[Atoms], directory: str | Path) -> None:
     -------
     None
     """
+    # pymatgen is slow to import, so only load it when CIFs are written
+    from pymatgen.io.ase import AseAtomsAdaptor
+
+    directory = Path(directory)
     for i, framework in enumerate(frameworks):
-        if framework == Atoms():
+        if len(framework) == 0:
             continue
-        name = f"framework{i}"
+        cif_path = directory / f"framework{i}.cif"
 
         structure = AseAtomsAdaptor.get_structure(framework)
-        structure.to(str(Path(directory, name + ".cif")), write_site_properties=True)
+        structure.to(str(cif_path), write_site_properties=True)
 
 
 def parse_output(filepath: str | Path) -> dict[str, Any]:
@@ -90,153 +87,190 @@ def parse_output(filepath: str | Path) -> dict[str, Any]:
         The parsed output data.
     """
 
-    def _clean(split_list: list[str]) -> list[float]:
-        """Strips and attempts to convert a list of strings to floats."""
+    info = {}
+    with Path(filepath).open(mode="r") as fd:
+        for key, values in _read_sections(fd):
+            info[key] = _parse_section(key, values)
+
+    return info
 
-        def try_float(s):
-            try:
-                return float(s)
-            except ValueError:
-                return s
 
-        return [try_float(s.strip()) for s in split_list if s]
+def _read_sections(fd: TextIO) -> Iterator[tuple[str, list[str]]]:
+    """
+    Lazily split a RASPA output file into its titled sections, reading it
+    line by line.
 
-    with Path(filepath).open(mode="r") as fd:
-        raspa_output = fd.read()
-
-    # Reads the string into a newline-separated list, skipping useless lines
-    data = [
-        row.strip()
-        for row in raspa_output.splitlines()
-        if row and all(d not in row for d in ["-----", "+++++"])
-    ]
-
-    # Generally, categories in the output are delimited by equal signs
-    delimiters = [
-        i
-        for i, row in enumerate(data)
-        if "=====" in row and "Exclusion constraints energy" not in data[i - 1]
-    ]
-
-    # Append a row for "absolute adsorption:" and "excess adsorption:"
-    # These values are separated into two rows
-    abs_adsorp_rows = [i for i, row in enumerate(data) if "absolute adsorption:" in row]
-    for row in abs_adsorp_rows:
-        data[row] += "  " + data[row + 1]
-        data[row + 2] += data[row + 3]
-        data[row + 1], data[row + 3] = " ", " "
-
-    # Use the delimiters to make a high-level dict. Title is row before
-    # delimiter, and content is every row after delimiter, up to the next title
-    info = {
-        data[n - 1].strip(":"): data[n + 1 : delimiters[i + 1] - 1]
-        for i, n in enumerate(delimiters[:-1])
-    }
-
-    # Let's PARSE!
-    for key, values in info.items():
-        d, note_index = {}, 1
-        for item in values:
-            # Takes care of all "Blocks[ #]", skipping hard-to-parse parts
-            if (
-                "Block" in item
-                and "Box-lengths" not in key
-                and "Van der Waals:" not in item
-            ):
-                blocks = _clean(item.split())
-                d["".join(blocks[:2])] = blocks[2:]
-
-            # Most of the average data values are parsed in this section
-            elif (
-                any(s in item for s in ["Average     ", "Surface area:"])
-                and "desorption" not in key
-            ):
-                average_data = _clean(item.split())
-                # Average values organized by its unit, many patterns here
-                if len(average_data) == 8:
-                    del average_data[2:4]
-                    d[" ".join(average_data[4:6])] = average_data[1:4]
-                elif len(average_data) == 5:
-                    d[average_data[-1]] = average_data[1:4]
-                elif "Surface" in average_data[0]:
-                    d[average_data[-1]] = average_data[2:5]
-                # This is the common case
-                else:
-                    del average_data[2]
-                    d[average_data[-1]] = average_data[1:4]
-
-            # Average box-lengths has its own pattern
-            elif "Box-lengths" in key:
-                box_lengths = _clean(item.split())
-                i = 3 if "angle" in item else 2
-                d[" ".join(box_lengths[:i])] = box_lengths[i:]
-
-            # "Heat of Desorption" section
-            elif "desorption" in key:
-                if "Note" in item:
-                    notes = re.split(r"[:\s]{2,}", item)
-                    d["%s %d" % (notes[0], note_index)] = notes[1]
-                    note_index += 1
-                else:
-                    heat_desorp = _clean(item.split())
-                    # One line has "Average" in front, force it to be normal
-                    if "Average" in item:
-                        del heat_desorp[0]
-                    d[heat_desorp[-1]] = heat_desorp[0:3]
-
-            # Parts where Van der Waals are included
-            elif (
-                "Host-" in key or "-Cation" in key or "Adsorbate-Adsorbate" in key
-            ) and "desorption" not in key:
-                van_der = item.split()
-                # First Column
-                if "Block" in van_der[0]:
-                    sub_data = [
-                        _clean(s.split(":")) for s in re.split(r"\s{2,}", item)[1:]
-                    ]
-                    sub_dict = {s[0]: s[1] for s in sub_data[:2]}
-                    d["".join(van_der[:2])] = [float(van_der[2]), sub_dict]
-                # Average for each columns
-                elif "Average" in item:
-                    avg = _clean(re.split(r"\s{2,}", item))
-                    vdw, coulomb = (_clean(s.split(": ")) for s in avg[2:4])
-                    d[avg[0]] = avg[1]
-                    d["Average %s" % vdw[0]] = vdw[1]
-                    d["Average %s" % coulomb[0]] = coulomb[1]
-                else:
-                    d["standard deviation"] = _clean(van_der)
-
-            # IMPORTANT STUFF
-            elif "Number of molecules" in key:
-                adsorb_data = _clean(item.rsplit(" ", 12))
-                if "Component" in item:
-                    gas_name = adsorb_data[2].strip("[]")
-                    d[gas_name] = {}
-                else:
-                    d[gas_name][adsorb_data[0]] = adsorb_data[1:]
-
-            # Henry and Widom
-            elif "Average Widom" in item:
-                d["Widom"] = _clean(item.rsplit(" ", 5))[1:]
-
-            elif "Average Henry" in item:
-                d["Henry"] = _clean(item.rsplit(" ", 5))[1:]
-
-            # Ignore these
-            elif any(
-                s in item
-                for s in ["=====", "Starting simulation", "Finishing simulation"]
-            ):
-                continue
-
-            # Other strings
+    Parameters
+    ----------
+    fd
+        The open RASPA output file.
+
+    Yields
+    ------
+    tuple[str, list[str]]
+        The title and stripped content rows of each section.
+    """
+    title, rows, previous_row = None, [], ""
+    output_rows = _read_rows(fd)
+    for row in output_rows:
+        # Generally, categories in the output are delimited by equal signs.
+        # Title is row before delimiter, and content is every row after
+        # delimiter, up to the next title
+        if "=====" in row and "Exclusion constraints energy" not in previous_row:
+            if title is not None:
+                # The last row is the title of the next section
+                del rows[-1:]
+                yield title, rows
+            title, rows = previous_row.strip(":"), []
+        else:
+            # The "absolute adsorption:" and "excess adsorption:" values are
+            # each split over two rows, so join them
+            if "absolute adsorption:" in row:
+                rows.append(row + "  " + next(output_rows))
+                rows.append(next(output_rows) + next(output_rows))
             else:
-                parsed_data = _clean(re.split(r"[()[\]:,\t]", item))
-                d[parsed_data[0]] = parsed_data[1:]
-        # Putting subdictionary back into main object
-        info[key] = d
+                rows.append(row)
+        previous_row = rows[-1] if rows else row
 
-    return info
+
+def _read_rows(fd: TextIO) -> Iterator[str]:
+    """
+    Lazily read the stripped rows of a RASPA output file, skipping empty lines
+    and separator lines.
+
+    Parameters
+    ----------
+    fd
+        The open RASPA output file.
+
+    Yields
+    ------
+    str
+        The stripped rows.
+    """
+    for line in fd:
+        row = line.rstrip("\n")
+        if row and "-----" not in row and "+++++" not in row:
+            yield row.strip()
+
+
+def _parse_section(key: str, values: list[str]) -> dict[str, Any]:
+    """
+    Parse the rows of a single section of a RASPA output file.
+
+    Parameters
+    ----------
+    key
+        The title of the section.
+    values
+        The rows of the section.
+
+    Returns
+    -------
+    dict
+        The parsed section data.
+    """
+    d, note_index = {}, 1
+
+    # The section title decides most of the parsing, so check it once
+    is_box_lengths = "Box-lengths" in key
+    is_desorption = "desorption" in key
+    is_energies = (
+        "Host-" in key or "-Cation" in key or "Adsorbate-Adsorbate" in key
+    ) and not is_desorption
+    is_molecules = "Number of molecules" in key
+
+    for item in values:
+        # Takes care of all "Blocks[ #]", skipping hard-to-parse parts
+        if "Block" in item and not is_box_lengths and "Van der Waals:" not in item:
+            blocks = _clean(item.split())
+            d["".join(blocks[:2])] = blocks[2:]
+
+        # Most of the average data values are parsed in this section
+        elif ("Average     " in item or "Surface area:" in item) and not is_desorption:
+            average_data = _clean(item.split())
+            # Average values organized by its unit, many patterns here
+            if len(average_data) == 8:
+                del average_data[2:4]
+                d[" ".join(average_data[4:6])] = average_data[1:4]
+            elif len(average_data) == 5:
+                d[average_data[-1]] = average_data[1:4]
+            elif "Surface" in average_data[0]:
+                d[average_data[-1]] = average_data[2:5]
+            # This is the common case
+            else:
+                del average_data[2]
+                d[average_data[-1]] = average_data[1:4]
+
+        # Average box-lengths has its own pattern
+        elif is_box_lengths:
+            box_lengths = _clean(item.split())
+            i = 3 if "angle" in item else 2
+            d[" ".join(box_lengths[:i])] = box_lengths[i:]
+
+        # "Heat of Desorption" section
+        elif is_desorption:
+            if "Note" in item:
+                notes = NOTE_SPLITTER.split(item)
+                d["%s %d" % (notes[0], note_index)] = notes[1]
+                note_index += 1
+            else:
+                heat_desorp = _clean(item.split())
+                # One line has "Average" in front, force it to be normal
+                if "Average" in item:
+                    del heat_desorp[0]
+                d[heat_desorp[-1]] = heat_desorp[0:3]
+
+        # Parts where Van der Waals are included
+        elif is_energies:
+            van_der = item.split()
+            # First Column
+            if "Block" in van_der[0]:
+                sub_data = [
+                    _clean(s.split(":")) for s in COLUMN_SPLITTER.split(item)[1:]
+                ]
+                sub_dict = {s[0]: s[1] for s in sub_data[:2]}
+                d["".join(van_der[:2])] = [float(van_der[2]), sub_dict]
+            # Average for each columns
+            elif "Average" in item:
+                avg = _clean(COLUMN_SPLITTER.split(item))
+                vdw, coulomb = (_clean(s.split(": ")) for s in avg[2:4])
+                d[avg[0]] = avg[1]
+                d["Average %s" % vdw[0]] = vdw[1]
+                d["Average %s" % coulomb[0]] = coulomb[1]
+            else:
+                d["standard deviation"] = _clean(van_der)
+
+        # IMPORTANT STUFF
+        elif is_molecules:
+            adsorb_data = _clean(item.rsplit(" ", 12))
+            if "Component" in item:
+                gas_name = adsorb_data[2].strip("[]")
+                d[gas_name] = {}
+            else:
+                d[gas_name][adsorb_data[0]] = adsorb_data[1:]
+
+        # Henry and Widom
+        elif "Average Widom" in item:
+            d["Widom"] = _clean(item.split()[-4:])
+
+        elif "Average Henry" in item:
+            d["Henry"] = _clean(item.split()[-4:])
+
+        # Ignore these
+        elif (
+            "=====" in item
+            or "Starting simulation" in item
+            or "Finishing simulation" in item
+        ):
+            continue
+
+        # Other strings
+        else:
+            parsed_data = _clean(FIELD_SPLITTER.split(item))
+            d[parsed_data[0]] = parsed_data[1:]
+
+    return d
 
 
 def _iterable_to_str(v: list[Any]) -> str:
@@ -253,29 +287,81 @@ def _iterable_to_str(v: list[Any]) -> str:
     str
         The space-separated string.
     """
-    return " ".join([str(i) for i in v]) + "\n"
+    return " ".join(map(str, v)) + "\n"
 
 
-def _dict_to_str(d: dict[str, Any]) -> str:
+def _dict_to_lines(d: dict[str, Any], indent: str = "") -> Iterator[str]:
     """
-    Convert a dictionary to a formatted string.
+    Lazily convert a dictionary to formatted lines, with nested dictionaries
+    indented by four additional spaces per level.
 
     Parameters
     ----------
     d
         The dictionary to convert.
+    indent
+        The indentation to prefix each line with.
 
-    Returns
-    -------
+    Yields
+    ------
     str
-        The formatted string.
+        The formatted lines, each ending in a newline.
     """
-    s = ""
     for k, v in d.items():
         if isinstance(v, dict):
-            s += f"    {k}\n    " + _dict_to_str(v)
-        elif isinstance(v, Iterable) and not isinstance(v, str):
-            s += f"    {k} " + _iterable_to_str(v)
+            yield f"{indent}{k}\n"
+            yield from _dict_to_lines(v, indent=f"{indent}    ")
+        elif isinstance(v, (list, tuple)) or (
+            not isinstance(v, str) and isinstance(v, Iterable)
+        ):
+            yield f"{indent}{k} " + _iterable_to_str(v)
         else:
-            s += f"    {k} {v}\n"
-    return s
+            yield f"{indent}{k} {_value_to_str(v)}\n"
+
+
+def _value_to_str(v: Any) -> str:
+    """
+    Convert a scalar value to a string, with booleans converted to "Yes" or "No".
+
+    Parameters
+    ----------
+    v
+        The value to convert.
+
+    Returns
+    -------
+    str
+        The formatted string.
+    """
+    if v is True:
+        return "Yes"
+    if v is False:
+        return "No"
+    return str(v)
+
+
+def _clean(split_list: list[str]) -> list[float | str]:
+    """
+    Strip and attempt to convert a list of strings to floats, skipping empty
+    strings.
+
+    Parameters
+    ----------
+    split_list
+        The strings to convert.
+
+    Returns
+    -------
+    list[float | str]
+        The converted values, with strings that are not floats left as-is.
+    """
+    cleaned = []
+    for s in split_list:
+        if not s:
+            continue
+        stripped = s.strip()
+        try:
+            cleaned.append(float(stripped))
+        except ValueError:
+            cleaned.append(stripped)
+    return cleaned
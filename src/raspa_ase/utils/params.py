@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import math
+import struct
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-import numpy as np
-from ase.atoms import Atoms
-
-from raspa_ase.utils.dicts import get_parameter, merge_parameters
+from raspa_ase.utils.dicts import merge_parameters
 
 if TYPE_CHECKING:
     from typing import Any
 
+    from ase.atoms import Atoms
+
 
-def get_framework_params(frameworks: list[Atoms]) -> dict[str, Any]:
+def get_framework_params(
+    frameworks: list[Atoms], cutoff: float = 12.0
+) -> dict[str, Any]:
     """
     Get the framework-related parameters.
 
@@ -19,6 +23,9 @@ def get_framework_params(frameworks: list[Atoms]) -> dict[str, Any]:
     ----------
     frameworks
         The frameworks to get the parameters for.
+    cutoff
+        The cutoff used for the calculation, in A. This is used to suggest
+        the number of unit cells.
 
     Returns
     -------
@@ -28,11 +35,10 @@ def get_framework_params(frameworks: list[Atoms]) -> dict[str, Any]:
 
     parameters = {}
     for i, framework in enumerate(frameworks):
-        if framework == Atoms():
+        if len(framework) == 0:
             continue
 
         name = f"framework{i}"
-        cutoff = get_parameter(parameters, "CutOff", default=12.0)
         n_cells = get_suggested_cells(framework, cutoff)
 
         framework_params = {
@@ -40,10 +46,8 @@ def get_framework_params(frameworks: list[Atoms]) -> dict[str, Any]:
             "UnitCells": n_cells,
         }
 
-        if framework.has("initial_charges"):
-            framework_params = merge_parameters(
-                framework_params, {"UseChargesFromCIFFile": True}
-            )
+        if "initial_charges" in framework.arrays:
+            framework_params["UseChargesFromCIFFile"] = True
 
         parameters[f"Framework {i}"] = merge_parameters(
             framework_params,
@@ -53,7 +57,7 @@ def get_framework_params(frameworks: list[Atoms]) -> dict[str, Any]:
     return parameters
 
 
-def get_suggested_cells(framework: Atoms, cutoff: float) -> list[int]:
+def get_suggested_cells(framework: Atoms, cutoff: float) -> tuple[int, int, int]:
     """
     Get the suggested number of unit cells in each dimension for a given cutoff.
 
@@ -69,15 +73,56 @@ def get_suggested_cells(framework: Atoms, cutoff: float) -> list[int]:
     tuple[int, int, int]
         The suggested number of unit cells in each dimension.
     """
-    A, B, C = framework.get_cell()[:3]
-
-    def _calculate_min_dist(v1, v2, v3):
-        cross_product = np.cross(v1, v2)
-        numerator = np.linalg.norm(np.dot(cross_product, v3))
-        denominator = np.linalg.norm(cross_product)
-        return np.divide(numerator, denominator)
-
-    min_A = _calculate_min_dist(B, C, A)
-    min_B = _calculate_min_dist(C, A, B)
-    min_C = _calculate_min_dist(A, B, C)
-    return [int(np.ceil(cutoff / (0.5 * min_i))) for min_i in [min_A, min_B, min_C]]
+    return _get_suggested_cells(framework.cell.array.tobytes(), cutoff)
+
+
+@lru_cache
+def _get_suggested_cells(cell_bytes: bytes, cutoff: float) -> tuple[int, int, int]:
+    """
+    Get the suggested number of unit cells in each dimension for a given cutoff.
+    The result is cached, keyed on the raw bytes of the cell matrix.
+
+    Parameters
+    ----------
+    cell_bytes
+        The 3x3 cell matrix (float64), as bytes.
+    cutoff
+        The cutoff used for the calculation, in A.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        The suggested number of unit cells in each dimension.
+    """
+    cell = struct.unpack("9d", cell_bytes)
+    A, B, C = cell[0:3], cell[3:6], cell[6:9]
+    cross_products = (_cross(B, C), _cross(C, A), _cross(A, B))
+
+    # The perpendicular width along each lattice vector is the cell volume
+    # divided by the area of the opposite face
+    volume = abs(sum(a * bc for a, bc in zip(A, cross_products[0])))
+    min_dists = (volume / math.hypot(*cross) for cross in cross_products)
+    return tuple(math.ceil(cutoff / (0.5 * min_dist)) for min_dist in min_dists)
+
+
+def _cross(
+    v1: tuple[float, float, float], v2: tuple[float, float, float]
+) -> tuple[float, float, float]:
+    """
+    Calculate the cross product of two 3-vectors.
+
+    Parameters
+    ----------
+    v1
+        The first vector.
+    v2
+        The second vector.
+
+    Returns
+    -------
+    tuple[float, float, float]
+        The cross product.
+    """
+    x1, y1, z1 = v1
+    x2, y2, z2 = v2
+    return (y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2)
@@ -10,11 +10,27 @@ from raspa_ase.calculator import Raspa, RaspaProfile, RaspaTemplate
 
 DATA_DIR = Path(__file__).parent / "data"
 
+# Probe for a usable RASPA binary once, rather than failing in every test
+# when RASPA_DIR points to a broken install
+requires_raspa = pytest.mark.skipif(
+    "RASPA_DIR" not in os.environ
+    or not os.access(Path(os.environ["RASPA_DIR"], "bin", "simulate"), os.X_OK),
+    reason="This test requires RASPA",
+)
+
 
 def test_profile_bad(monkeypatch):
     monkeypatch.delenv("RASPA_DIR", "/tmp")
+    profile = RaspaProfile()
     with pytest.raises(OSError):
-        RaspaProfile()
+        profile.get_calculator_command()
+
+
+def test_profile_lazy(monkeypatch):
+    monkeypatch.delenv("RASPA_DIR", "/tmp")
+    calc = Raspa()
+    monkeypatch.setenv("RASPA_DIR", "/my/raspa")
+    assert calc.profile.command == "/my/raspa/bin/simulate"
 
 
 def test_profile():
@@ -55,7 +71,7 @@ def test_notimplemented():
 
 def test_template_execute(monkeypatch, tmp_path):
     monkeypatch.chdir(tmp_path)
-    with Path(tmp_path / "simulation.input").open(mode="w") as fd:
+    with (tmp_path / "simulation.input").open(mode="w") as fd:
         fd.write("")
     template = RaspaTemplate()
     template.execute(tmp_path, RaspaProfile())
@@ -70,7 +86,7 @@ def test_template_write_input(monkeypatch, tmp_path):
     assert (tmp_path / "simulation.input").exists()
     assert (
         tmp_path / "simulation.input"
-    ).read_text() == "CutOff 12.8\nFramework 0\n    FrameworkName framework0\n    UnitCells 12 12 12\n"
+    ).read_text() == "CutOff 12.8\nFramework 0\n    FrameworkName framework0\n    UnitCells 13 13 13\n"
     assert (tmp_path / "framework0.cif").exists()
 
 
@@ -122,8 +138,9 @@ def test_raspa_functional1(tmp_path):
     atoms = Atoms()
     atoms.calc = Raspa(directory=tmp_path)
     atoms.get_potential_energy()
-    assert Path(tmp_path / "simulation.input").exists()
-    assert Path(tmp_path / "simulation.input").read_text() == ""
+    assert (tmp_path / "simulation.input").exists()
+    assert (tmp_path / "simulation.input").read_text() == ""
+    assert not list(tmp_path.glob("framework*.cif"))
 
 
 def test_raspa_functional2(tmp_path):
@@ -143,10 +160,10 @@ def test_raspa_functional2(tmp_path):
         ],
     )
     atoms.get_potential_energy()
-    assert Path(tmp_path, "simulation.input").exists()
+    assert (tmp_path / "simulation.input").exists()
     assert (
-        Path(tmp_path / "simulation.input").read_text()
-        == "CutOff 12.8\nComponent 0 MoleculeName N2\n    MoleculeDefinition ExampleDefinition\nComponent 1 MoleculeName CO2\n    MoleculeDefinition ExampleDefinition\n    TranslationProbability 1.0\nBox 0\n    BoxLengths 1 2 3\nBox 1\n    BoxLengths 4 5 6\nFramework 0\n    FrameworkName framework0\n    UnitCells 12 12 12\n    UseChargesFromCIFFile Yes\n"
+        (tmp_path / "simulation.input").read_text()
+        == "CutOff 12.8\nComponent 0 MoleculeName N2\n    MoleculeDefinition ExampleDefinition\nComponent 1 MoleculeName CO2\n    MoleculeDefinition ExampleDefinition\n    TranslationProbability 1.0\nBox 0\n    BoxLengths 1 2 3\nBox 1\n    BoxLengths 4 5 6\nFramework 0\n    FrameworkName framework0\n    UnitCells 13 13 13\n    UseChargesFromCIFFile Yes\n"
     )
 
 
@@ -170,23 +187,23 @@ def test_multi_frameworks(tmp_path):
         ],
     )
     atoms.get_potential_energy()
-    assert Path(tmp_path, "simulation.input").exists()
-    input_str = Path(tmp_path / "simulation.input").read_text()
+    assert (tmp_path / "simulation.input").exists()
+    input_str = (tmp_path / "simulation.input").read_text()
     assert (
-        "Framework 0\n    FrameworkName framework0\n    UnitCells 12 12 12\n    HeliumVoidFraction 0.75\n"
+        "Framework 0\n    FrameworkName framework0\n    UnitCells 13 13 13\n    HeliumVoidFraction 0.75\n"
         in input_str
     )
     assert (
-        "Framework 1\n    FrameworkName framework1\n    UnitCells 12 12 12\n"
+        "Framework 1\n    FrameworkName framework1\n    UnitCells 13 13 13\n"
         in input_str
     )
-    assert Path(tmp_path / "framework0.cif").exists()
-    assert Path(tmp_path / "framework1.cif").exists()
+    assert (tmp_path / "framework0.cif").exists()
+    assert (tmp_path / "framework1.cif").exists()
     assert read(tmp_path / "framework0.cif")[0].symbol == "Cu"
     assert read(tmp_path / "framework1.cif")[0].symbol == "Fe"
 
 
-@pytest.mark.skipif("RASPA_DIR" not in os.environ, reason="This test requires RASPA")
+@requires_raspa
 def test_example(tmp_path):
     atoms = Atoms()
     boxes = [
@@ -225,7 +242,7 @@ def test_example(tmp_path):
     ] == [3.0]
 
 
-@pytest.mark.skipif("RASPA_DIR" not in os.environ, reason="This test requires RASPA")
+@requires_raspa
 def test_example2(tmp_path):
     atoms = Atoms()
     boxes = [
@@ -280,9 +297,9 @@ def test_example2(tmp_path):
     assert "output_Box_1.1.1_500.000000_0.data" in calc.results["System_1"]
 
 
-@pytest.mark.skipif("RASPA_DIR" not in os.environ, reason="This test requires RASPA")
+@requires_raspa
 def test_example3(tmp_path):
-    atoms = read(Path(DATA_DIR / "MFI_SI.cif"))
+    atoms = read(DATA_DIR / "MFI_SI.cif")
     atoms.info = {
         "UnitCells": [2, 2, 2],
         "HeliumVoidFraction": 0.29,
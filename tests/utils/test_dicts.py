@@ -7,8 +7,13 @@ from raspa_ase.utils.dicts import (
 
 
 def test_convert_booleans():
-    d = {"a": True, "b": {"c": False}, "d": "wow"}
-    assert convert_booleans(d) == {"a": "Yes", "b": {"c": "No"}, "d": "wow"}
+    d = {"a": True, "b": {"c": False, "e": 0}, "d": "wow", "f": 1}
+    assert convert_booleans(d) == {
+        "a": "Yes",
+        "b": {"c": "No", "e": 0},
+        "d": "wow",
+        "f": 1,
+    }
 
 
 def test_get_parameter():
@@ -23,6 +28,7 @@ def test_merge_parameters():
     d1 = {"a": 1, "b": 2}
     d2 = {"A": 3, "C": 4}
     assert merge_parameters(d1, d2) == {"a": 3, "b": 2, "C": 4}
+    assert d1 == {"a": 1, "b": 2}
 
 
 def test_pop_parameter():
@@ -30,3 +36,13 @@ def test_pop_parameter():
     assert pop_parameter(d, "A") == 1
     assert pop_parameter(d, "c") is None
     assert d == {"b": 2}
+
+
+def test_convert_booleans_deeply_nested():
+    d = leaf = {}
+    for _ in range(5000):
+        leaf["a"] = {}
+        leaf = leaf["a"]
+    leaf["b"] = True
+    convert_booleans(d)
+    assert leaf == {"b": "Yes"}
@@ -1,6 +1,8 @@
+from io import StringIO
+
 from ase.build import bulk
 
-from raspa_ase.utils.io import write_frameworks, write_simulation_input
+from raspa_ase.utils.io import parse_output, write_frameworks, write_simulation_input
 
 
 def test_write_simulation_input(tmp_path):
@@ -13,8 +15,31 @@ def test_write_simulation_input(tmp_path):
     )
 
 
+def test_write_simulation_input_nested():
+    parameters = {"a": (1, 2), "b": {"c": {"d": 1, "e": [2, 3]}, "f": True}}
+    fd = StringIO()
+    write_simulation_input(parameters, fd)
+    assert fd.getvalue() == "a 1 2\nb\n    c\n        d 1\n        e 2 3\n    f Yes\n"
+
+
 def test_write_frameworks(tmp_path):
     frameworks = [bulk("Cu"), bulk("Cu")]
     write_frameworks(frameworks, tmp_path)
     assert (tmp_path / "framework0.cif").exists()
     assert (tmp_path / "framework1.cif").exists()
+
+
+def test_write_simulation_input_no_mutation():
+    parameters = {"a": True, "b": {"c": False}}
+    fd = StringIO()
+    write_simulation_input(parameters, fd)
+    assert parameters == {"a": True, "b": {"c": False}}
+    assert fd.getvalue() == "a Yes\nb\n    c No\n"
+
+
+def test_parse_output(tmp_path):
+    output = "Header\nSimulation:\n=====\nDimensions: 3\n\n-----\nCutoff: 12.0\nEnd:\n=====\nDone\n"
+    (tmp_path / "output.data").write_text(output)
+    assert parse_output(tmp_path / "output.data") == {
+        "Simulation": {"Dimensions": [3.0], "Cutoff": [12.0]}
+    }
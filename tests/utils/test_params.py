@@ -1,11 +1,28 @@
+from ase import Atoms
 from ase.build import bulk
 
-from raspa_ase.utils.params import get_framework_params, get_suggested_cells
+from raspa_ase.utils.params import (
+    _get_suggested_cells,
+    get_framework_params,
+    get_suggested_cells,
+)
 
 
 def test_get_suggested_cells():
-    assert get_suggested_cells(bulk("Cu"), cutoff=12) == [12, 12, 12]
-    assert get_suggested_cells(bulk("Cu"), cutoff=4) == [4, 4, 4]
+    assert get_suggested_cells(bulk("Cu"), cutoff=12) == (12, 12, 12)
+    assert get_suggested_cells(bulk("Cu"), cutoff=4) == (4, 4, 4)
+
+
+def test_get_suggested_cells_triclinic():
+    atoms = Atoms(cell=[[10, 0, 0], [-5, 8.66, 0], [0, 0, 20]], pbc=True)
+    assert get_suggested_cells(atoms, cutoff=12) == (3, 3, 2)
+
+
+def test_get_suggested_cells_cached():
+    hits = _get_suggested_cells.cache_info().hits
+    assert get_suggested_cells(bulk("Cu"), cutoff=13) == (13, 13, 13)
+    assert get_suggested_cells(bulk("Cu"), cutoff=13) == (13, 13, 13)
+    assert _get_suggested_cells.cache_info().hits == hits + 1
 
 
 def test_get_framework_params():
@@ -17,10 +34,15 @@ def test_get_framework_params():
     assert "Framework 1" in framework_params
     assert framework_params["Framework 0"] == {
         "FrameworkName": "framework0",
-        "UnitCells": [12, 12, 12],
+        "UnitCells": (12, 12, 12),
         "HeliumVoidFraction": 0.75,
     }
     assert framework_params["Framework 1"] == {
         "FrameworkName": "framework1",
         "UnitCells": [1, 2, 3],
     }
+
+
+def test_get_framework_params_cutoff():
+    framework_params = get_framework_params([bulk("Cu")], cutoff=4)
+    assert framework_params["Framework 0"]["UnitCells"] == (4, 4, 4)